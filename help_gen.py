@@ -2,8 +2,20 @@
 import ast
 import json
 import os
-import hashlib
-from typing import Dict, List, Optional
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Stored with each module's checksums so a change of hash backend invalidates them
+CHECKSUM_ALGO = "xxh3_128" if xxhash is not None else "blake2b_128"
+
+# Constant types whose repr() matches ast.unparse; floats and complex numbers can be inf/nan
+_REPR_SAFE_CONSTANTS = (type(None), bool, int, str)
 
 
 class HelpFileGen:
@@ -19,32 +31,31 @@ class HelpFileGen:
         self.output_file = f"{module_path.replace('.py','').replace(' ','_')}-{output_file}"
         self.overwrite = overwrite
         self.args_seperatly = include_args
+        self._ensure_jsondata_dir_exists()
         self.exclusion_list = self._load_exclusion_list()
         self.checksum_file = os.path.join(".jsondata", f"{os.path.basename(module_path)}.checksums.json")
-        self._ensure_jsondata_dir_exists()
+        self.rendered_file = os.path.join(".jsondata", f"{os.path.basename(module_path)}.rendered.json")
         self.generate_help_file()
 
     def _ensure_jsondata_dir_exists(self) -> None:
         """Ensures the .jsondata directory exists."""
-        if not os.path.exists(".jsondata"):
-            os.makedirs(".jsondata")
+        os.makedirs(".jsondata", exist_ok=True)
 
-    def _load_exclusion_list(self) -> List[str]:
+    def _load_exclusion_list(self) -> FrozenSet[str]:
         """Loads the exclusion list from a JSON file or creates it if it doesn't exist.
 
         Returns:
-            list: List of function names to exclude.
+            frozenset: Set of function names to exclude.
         """
         exclusion_path = ".jsondata/exclude_help_ast.json"
-        self._ensure_jsondata_dir_exists()
 
         if not os.path.exists(exclusion_path):
             with open(exclusion_path, "w", encoding="utf-8") as f:
                 json.dump([], f)
-            return []
+            return frozenset()
 
         with open(exclusion_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            return frozenset(json.load(f))
     
     def _load_checksums(self) -> Dict[str, str]:
         """Loads the checksums of previous AST nodes.
@@ -56,17 +67,95 @@ class HelpFileGen:
             return {}
         
         with open(self.checksum_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+            checksums = json.load(f)
+        
+        # Checksums from another hash algorithm can never match, start over
+        if checksums.pop("__algo__", None) != CHECKSUM_ALGO:
+            return {}
+        # Changed render options invalidate the file hash and every node checksum
+        if checksums.pop("__options__", None) != self._render_options():
+            return {}
+        return checksums
     
     def _save_checksums(self, checksums: Dict[str, str]) -> None:
-        """Saves the current checksums to file.
+        """Saves the current checksums to the module's checksum file.
         
         Args:
             checksums (dict): Dictionary mapping node names to their checksums.
         """
-        with open(self.checksum_file, "w", encoding="utf-8") as f:
-            json.dump(checksums, f, indent=2)
+        entry = {"__algo__": CHECKSUM_ALGO, "__options__": self._render_options(), **checksums}
+        self._write_if_changed(self.checksum_file, json.dumps(entry, indent=2))
+        # Drop shelve files left by older versions without ever opening them
+        for legacy_file in Path(".jsondata").glob(f"{os.path.basename(self.module_path)}.checksums.db*"):
+            legacy_file.unlink()
+    
+    def _write_if_changed(self, path: str, content: str) -> bool:
+        """Writes text to a file unless it already holds exactly that content.
+        
+        Args:
+            path (str): File to write.
+            content (str): Text to store.
+            
+        Returns:
+            bool: True if the file was written, False if it was already up to date.
+        """
+        target = Path(path)
+        if target.exists() and target.read_text(encoding="utf-8") == content:
+            return False
+        target.write_text(content, encoding="utf-8")
+        return True
+    
+    def _render_options(self) -> Dict:
+        """Returns the generator options that affect rendered markdown."""
+        return {"include_args": self.args_seperatly, "exclude": sorted(self.exclusion_list)}
+    
+    def _load_rendered_cache(self) -> Dict[str, Dict]:
+        """Loads the rendered markdown of previous AST nodes.
+        
+        Returns:
+            dict: Dictionary mapping node names to their checksum, owning class and markdown fragments.
+        """
+        if not os.path.exists(self.rendered_file):
+            return {}
+        
+        with open(self.rendered_file, "r", encoding="utf-8") as f:
+            rendered = json.load(f)
+        
+        # Markdown rendered with different options can't be reused
+        if rendered.pop("__options__", None) != self._render_options():
+            return {}
+        return rendered
+    
+    def _save_rendered_cache(self, rendered: Dict[str, Dict]) -> None:
+        """Saves the rendered markdown of the current AST nodes.
+        
+        Args:
+            rendered (dict): Dictionary mapping node names to their checksum, owning class and markdown fragments.
+        """
+        self._write_if_changed(self.rendered_file, json.dumps({"__options__": self._render_options(), **rendered}, indent=2))
+    
+    def _new_hasher(self):
+        """Creates a fresh hash object for change detection.
+        
+        Returns:
+            Hash object: xxh3-128 if xxhash is installed, otherwise a 128-bit BLAKE2b.
+        """
+        if xxhash is not None:
+            return xxhash.xxh3_128()
+        return blake2b(digest_size=16)
     
+    def _hash_file_content(self, data: bytes) -> str:
+        """Hashes the raw module source for the whole-file change check.
+        
+        Args:
+            data (bytes): Raw contents of the module file.
+            
+        Returns:
+            str: Hex digest of the module contents.
+        """
+        if xxhash is not None:
+            return xxhash.xxh3_128_hexdigest(data)
+        return blake2b(data, digest_size=16).hexdigest()
     
     
     def _get_argument_details(self, node: ast.FunctionDef) -> List[str]:
@@ -107,12 +196,22 @@ class HelpFileGen:
         """Extracts type annotation as string."""
         if annotation_node is None:
             return "Any"
+        # Fast path for plain names and constants such as `str` or `"Point"`
+        if isinstance(annotation_node, ast.Name):
+            return annotation_node.id
+        if isinstance(annotation_node, ast.Constant) and type(annotation_node.value) in _REPR_SAFE_CONSTANTS:
+            return repr(annotation_node.value)
         return ast.unparse(annotation_node) if hasattr(ast, 'unparse') else self._format_annotation(annotation_node)
     
     def _unparse_or_format(self, node: ast.AST) -> str:
         """Safely unparse or format an AST node."""
         if node is None:
             return "None"
+        # Fast path for plain names and constants such as `x=None` or `y=0`
+        if isinstance(node, ast.Name):
+            return node.id
+        if isinstance(node, ast.Constant) and type(node.value) in _REPR_SAFE_CONSTANTS:
+            return repr(node.value)
         try:
             return ast.unparse(node) if hasattr(ast, 'unparse') else self._format_default(node)
         except Exception:
@@ -134,30 +233,41 @@ class HelpFileGen:
             return f"{self._format_annotation(node.value)}.{node.attr}"
         return "Any"
     
+    # Fallback formatters for default values, dispatched on the exact node type
+    _DEFAULT_FORMATTERS = {
+        ast.Constant: lambda self, node: repr(node.value),
+        ast.Name: lambda self, node: node.id,
+        ast.Attribute: lambda self, node: f"{self._format_default(node.value)}.{node.attr}",
+        ast.List: lambda self, node: f"[{', '.join(self._format_default(e) for e in node.elts)}]",
+        ast.Tuple: lambda self, node: f"({', '.join(self._format_default(e) for e in node.elts)})",
+        ast.Dict: lambda self, node: self._format_default_dict(node),
+    }
+    
     def _format_default(self, node: ast.AST) -> str:
         """Fallback default value formatting with proper None checking."""
         if node is None:
             return "None"
         
-        if isinstance(node, ast.Constant):
-            return repr(node.value)
-        elif isinstance(node, ast.Name):
+        formatter = self._DEFAULT_FORMATTERS.get(type(node))
+        if formatter is None:
+            return "..."
+        return formatter(self, node)
+    
+    def _format_default_dict(self, node: ast.Dict) -> str:
+        """Fallback formatting for dictionary defaults."""
+        # Safely handle dictionary with None checks
+        pairs = []
+        for k, v in zip(node.keys, node.values):
+            key_str = self._format_default(k) if k is not None else "None"
+            val_str = self._format_default(v) if v is not None else "None"
+            pairs.append(f"{key_str}: {val_str}")
+        return f"{{{', '.join(pairs)}}}"
+    
+    def _fingerprint(self, node: ast.AST) -> str:
+        """Returns a cheap source-like string identifying an expression node for checksums."""
+        if isinstance(node, ast.Name):
             return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{self._format_default(node.value)}.{node.attr}"
-        elif isinstance(node, ast.List):
-            return f"[{', '.join(self._format_default(e) for e in node.elts)}]"
-        elif isinstance(node, ast.Tuple):
-            return f"({', '.join(self._format_default(e) for e in node.elts)})"
-        elif isinstance(node, ast.Dict):
-            # Safely handle dictionary with None checks
-            pairs = []
-            for k, v in zip(node.keys, node.values):
-                key_str = self._format_default(k) if k is not None else "None"
-                val_str = self._format_default(v) if v is not None else "None"
-                pairs.append(f"{key_str}: {val_str}")
-            return f"{{{', '.join(pairs)}}}"
-        return "..."
+        return ast.unparse(node) if hasattr(ast, 'unparse') else ast.dump(node)
     
     def _get_function_signature(self, node: ast.FunctionDef) -> str:
         """Generates a complete signature string for a function node.
@@ -186,8 +296,16 @@ class HelpFileGen:
         kwarg = f"**{node.args.kwarg.arg}" if node.args.kwarg else ""
         
         # Defaults
-        defaults = [ast.dump(d) for d in (node.args.defaults or [])]
-        kw_defaults = [ast.dump(d) for d in (node.args.kw_defaults or []) if d is not None]
+        defaults = [self._fingerprint(d) for d in (node.args.defaults or [])]
+        # Keep the slot of keyword-only args without a default so defaults can't shift between them
+        kw_defaults = [self._fingerprint(d) if d is not None else "" for d in (node.args.kw_defaults or [])]
+        
+        # Annotations are shown in the rendered Arguments section, so they must change the checksum too
+        annotations = [
+            self._fingerprint(arg.annotation) if arg.annotation is not None else ""
+            for arg in (node.args.args + node.args.kwonlyargs)
+        ]
+        returns = self._fingerprint(node.returns) if node.returns is not None else ""
         
         # Build signature string
         sig_parts = []
@@ -208,39 +326,80 @@ class HelpFileGen:
             signature += f" defaults={defaults}"
         if kw_defaults:
             signature += f" kw_defaults={kw_defaults}"
+        if any(annotations):
+            signature += f" annotations={annotations}"
+        if returns:
+            signature += f" -> {returns}"
         
         return signature
     
 
-    def _calculate_node_checksum(self, node: ast.AST) -> str:
+    def _get_cached_docstring(self, node: ast.AST, doc_cache: Dict[int, Optional[str]]) -> Optional[str]:
+        """Returns the docstring of a node, memoized by node identity."""
+        key = id(node)
+        if key not in doc_cache:
+            doc_cache[key] = ast.get_docstring(node)
+        return doc_cache[key]
+    
+    def _get_cached_signature(self, node: ast.FunctionDef, sig_cache: Dict[int, str]) -> str:
+        """Returns the signature string of a function node, memoized by node identity."""
+        key = id(node)
+        if key not in sig_cache:
+            sig_cache[key] = self._get_function_signature(node)
+        return sig_cache[key]
+
+    def _calculate_node_checksum(self, node: ast.AST, sig_cache: Optional[Dict[int, str]] = None,
+                                 doc_cache: Optional[Dict[int, Optional[str]]] = None) -> str:
         """Calculates a checksum for an AST node that includes docstrings and signatures.
         
         Args:
             node (ast.AST): The AST node to checksum.
+            sig_cache (dict): Optional signature cache shared with the caller, keyed by node id.
+            doc_cache (dict): Optional docstring cache shared with the caller, keyed by node id.
             
         Returns:
-            str: SHA256 checksum of the node's relevant attributes.
+            str: 128-bit checksum (xxh3 or BLAKE2b) of the node's relevant attributes.
         """
+        if sig_cache is None:
+            sig_cache = {}
+        if doc_cache is None:
+            doc_cache = {}
+        
+        h = self._new_hasher()
+        
         if isinstance(node, ast.ClassDef):
             # For classes, include: name, docstring, bases, decorators, and method signatures
-            content = f"ClassDef:{node.name}:{ast.get_docstring(node) or ''}:"
-            content += f"bases:{','.join(ast.dump(base) for base in node.bases)}:"
-            content += f"decorators:{','.join(ast.dump(dec) for dec in node.decorator_list)}:"
+            h.update(f"ClassDef:{node.name}:{self._get_cached_docstring(node, doc_cache) or ''}:".encode('utf-8'))
+            h.update(b"bases:")
+            self._update_joined(h, (self._fingerprint(base) for base in node.bases))
+            h.update(b":decorators:")
+            self._update_joined(h, (self._fingerprint(dec) for dec in node.decorator_list))
+            h.update(b":")
             
             # Include method signatures and docstrings
             for item in node.body:
                 if isinstance(item, ast.FunctionDef):
-                    content += f"|{item.name}:{self._get_function_signature(item)}:{ast.get_docstring(item) or ''}"
-            return hashlib.sha256(content.encode('utf-8')).hexdigest()
+                    h.update(f"|{item.name}:{self._get_cached_signature(item, sig_cache)}:".encode('utf-8'))
+                    h.update((self._get_cached_docstring(item, doc_cache) or '').encode('utf-8'))
+            return h.hexdigest()
         
         elif isinstance(node, ast.FunctionDef):
             # For functions, include: name, docstring, decorators, and full signature
-            content = f"FunctionDef:{node.name}:{ast.get_docstring(node) or ''}:"
-            content += f"decorators:{','.join(ast.dump(dec) for dec in node.decorator_list)}:"
-            content += f"signature:{self._get_function_signature(node)}"
-            return hashlib.sha256(content.encode('utf-8')).hexdigest()
+            h.update(f"FunctionDef:{node.name}:{self._get_cached_docstring(node, doc_cache) or ''}:".encode('utf-8'))
+            h.update(b"decorators:")
+            self._update_joined(h, (self._fingerprint(dec) for dec in node.decorator_list))
+            h.update(f":signature:{self._get_cached_signature(node, sig_cache)}".encode('utf-8'))
+            return h.hexdigest()
         
-        return hashlib.sha256(ast.dump(node).encode('utf-8')).hexdigest()
+        h.update(ast.dump(node).encode('utf-8'))
+        return h.hexdigest()
+    
+    def _update_joined(self, h, parts: Iterable[str]) -> None:
+        """Feeds comma separated parts into a running hash without building the joined string."""
+        for i, part in enumerate(parts):
+            if i:
+                h.update(b",")
+            h.update(part.encode('utf-8'))
     
 
     def _extract_help_from_docstring(self, docstring: Optional[str]) -> Optional[str]:
@@ -256,23 +415,141 @@ class HelpFileGen:
             return None
         return docstring.strip()
     
+    def _render_class(self, node: ast.ClassDef, doc_cache: Dict[int, Optional[str]]) -> List[str]:
+        """Renders the markdown fragments for a class and its methods.
+
+        Args:
+            node (ast.ClassDef): The class node.
+            doc_cache (dict): Docstring cache shared with the checksum pass, keyed by node id.
+
+        Returns:
+            list: Markdown fragments in output order.
+        """
+        class_name = node.name
+        help_content = []
+        cls_lower = class_name.lower()
+        class_anchor = f"class-{cls_lower}"
+        
+        # Class header with HTML anchor
+        help_content.append(f'<a id="{class_anchor}"></a>\n')
+        help_content.append(f"## Class: `{class_name}`\n")
+        
+        # Documented methods with their anchors, shared by the quick links and the method sections
+        methods = [
+            (child, f"method-{cls_lower}-{child.name.lower()}")
+            for child in node.body
+            if isinstance(child, ast.FunctionDef) and child.name not in self.exclusion_list
+        ]
+        
+        # Collect method names for quick links
+        method_links = [f"[`{child.name}`](#{method_anchor})" for child, method_anchor in methods]
+        back_link = f"\n\n[Back to `{class_name}`](#{class_anchor}) or [Classes](#top)\n\n"
+        
+        # Add quick jump links section if methods exist
+        if method_links:
+            help_content.append(f"### Quick Links:\n")
+            help_content.append(" | ".join(method_links))
+            help_content.append("\n")
+
+        # Process methods
+        for child, method_anchor in methods:
+            parts = [f'<a id="{method_anchor}"></a>\n', f"### Method: `{child.name}`\n"]
+            
+            arg_details = self._get_argument_details(child)
+            if self.args_seperatly == True:
+                parts.append("#### Arguments:\n")
+                parts.append("\n".join(f"- {arg}" for arg in arg_details))
+            
+            help_text = self._extract_help_from_docstring(self._get_cached_docstring(child, doc_cache))
+            if help_text:
+                parts.append(f"\n#### Help:\n> {help_text}\n")
+            else:
+                parts.append("\n#### Help:\n> No help provided.\n")
+            
+            parts.append(f"\n#### Usage:\n ```python\n{self.generate_usage_code(class_name, child.name, arg_details)}\n```\n")
+
+            # Add "Back to Class" link
+            parts.append(back_link)
+
+            help_content.append("".join(parts))
+
+        return help_content
+
+    def _render_function(self, node: ast.FunctionDef, class_name: Optional[str], doc_cache: Dict[int, Optional[str]]) -> str:
+        """Renders the markdown entry for a standalone function.
+
+        Args:
+            node (ast.FunctionDef): The function node.
+            class_name (str): Name of the closest preceding class used for the usage example, or None to call the function directly.
+            doc_cache (dict): Docstring cache shared with the checksum pass, keyed by node id.
+
+        Returns:
+            str: Markdown entry for the function.
+        """
+        func_anchor = f"func-{node.name.lower()}"
+        parts = [f'<a id="{func_anchor}"></a>\n', f"## Function: `{node.name}`\n"]
+        
+        arg_details = self._get_argument_details(node)
+        if self.args_seperatly == True:
+            parts.append("### Arguments:\n")
+            parts.append("\n".join(f"- {arg}" for arg in arg_details))
+        
+        help_text = self._extract_help_from_docstring(self._get_cached_docstring(node, doc_cache))
+        if help_text:
+            parts.append(f"\n### Help:\n> {help_text}\n")
+        else:
+            parts.append("\n### Help:\n> No help provided.\n")
+        
+        parts.append(f"\n### Usage:\n```python\n{self.generate_usage_code(class_name, node.name, arg_details)}\n```\n")
+
+        parts.append("\n[Back to top](#top)\n\n")
+        return "".join(parts)
+
     def _generate_help_content(self) -> str:
         """Walks the AST of the module and generates help content with navigation links."""
-        help_content = []
-        class_methods = {}
         current_checksums = {}
+        sig_cache: Dict[int, str] = {}
+        doc_cache: Dict[int, Optional[str]] = {}
         previous_checksums = self._load_checksums()
+        previous_file_hash = previous_checksums.pop("__file__", None)
         needs_update = False
+        output_exists = os.path.exists(self.output_file)
     
-        with open(self.module_path, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read(), filename=self.module_path)
+        with open(self.module_path, "rb") as f:
+            data = f.read()
+        
+        # Skip parsing entirely when the module source is byte-for-byte unchanged
+        file_hash = self._hash_file_content(data)
+        if file_hash == previous_file_hash and output_exists:
+            print(f"No changes detected in module {self.module_path}, help file is up to date.")
+            return ""
     
-        # First pass: collect checksums
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
-                node_name = f"{node.name}" if isinstance(node, ast.FunctionDef) else f"class_{node.name}"
-                current_checksums[node_name] = self._calculate_node_checksum(node)
+        tree = ast.parse(data, filename=self.module_path)
     
+        # Collect checksums from module-level nodes only; methods are folded into their class checksum
+        # The same pass collects the table of contents links
+        render_entries = []
+        toc_classes = []
+        toc_funcs = []
+        class_name = None
+        for node in tree.body:
+            node_type = type(node)
+            if node_type is ast.ClassDef:
+                node_name = "class_" + node.name
+                checksum = self._calculate_node_checksum(node, sig_cache, doc_cache)
+                current_checksums[node_name] = checksum
+                class_name = node.name
+                render_entries.append((node_name, checksum, node, None))
+                toc_classes.append(f"[`{node.name}`](#class-{node.name.lower()})")
+            elif node_type is ast.FunctionDef:
+                node_name = node.name
+                checksum = self._calculate_node_checksum(node, sig_cache, doc_cache)
+                current_checksums[node_name] = checksum
+                if node.name not in self.exclusion_list:
+                    # Standalone usage examples reference the closest preceding class
+                    render_entries.append((node_name, checksum, node, class_name))
+                    toc_funcs.append(f"[`{node.name}`](#func-{node.name.lower()})")
+
         # Check if update is needed
         if set(current_checksums.keys()) != set(previous_checksums.keys()):
             needs_update = True
@@ -281,129 +558,70 @@ class HelpFileGen:
                 if previous_checksums.get(node_name) != checksum:
                     needs_update = True
                     break
-    
+        current_checksums["__file__"] = file_hash
+
         if not needs_update and os.path.exists(self.output_file):
             print(f"No changes detected in module {self.module_path}, help file is up to date.")
             self._save_checksums(current_checksums)
             return ""
-    
-        # Second pass: generate content with navigation
-        for node in tree.body:
+
+        # Reuse rendered markdown for unchanged nodes and only render the rest
+        previous_rendered = self._load_rendered_cache()
+        rendered_fragments = []
+        pending = []
+        for i, (node_name, checksum, node, owner) in enumerate(render_entries):
+            cached = previous_rendered.get(node_name)
+            if cached and cached["checksum"] == checksum and cached["owner"] == owner:
+                rendered_fragments.append(cached["fragments"])
+            else:
+                rendered_fragments.append(None)
+                pending.append(i)
+        
+        # Render each changed node, keeping module order
+        for i in pending:
+            _, _, node, owner = render_entries[i]
             if isinstance(node, ast.ClassDef):
-                class_name = node.name
-                class_methods[class_name] = []
-                class_anchor = f"class-{class_name.lower()}"
-                
-                # Class header with HTML anchor
-                help_content.append(f'<a id="{class_anchor}"></a>\n')
-                help_content.append(f"## Class: `{class_name}`\n")
-                
-                # Collect method names for quick links
-                method_links = []
-                for child in node.body:
-                    if isinstance(child, ast.FunctionDef) and child.name not in self.exclusion_list:
-                        method_anchor = f"method-{class_name.lower()}-{child.name.lower()}"
-                        method_links.append(f"[`{child.name}`](#{method_anchor})")
-                
-                # Add quick jump links section if methods exist
-                if method_links:
-                    help_content.append(f"### Quick Links:\n")
-                    help_content.append(" | ".join(method_links))
-                    help_content.append("\n")
-    
-                # Process methods
-                for child in node.body:
-                    if isinstance(child, ast.FunctionDef):
-                        if child.name in self.exclusion_list:
-                            continue
-                        
-                        method_anchor = f"method-{class_name.lower()}-{child.name.lower()}"
-                        help_entry = f'<a id="{method_anchor}"></a>\n'
-                        help_entry += f"### Method: `{child.name}`\n"
-                        
-                        if self.args_seperatly == True:
-                            help_entry += "#### Arguments:\n"
-                            arg_details = self._get_argument_details(child)
-                            help_entry += "\n".join(f"- {arg}" for arg in arg_details)
-                        
-                        help_text = self._extract_help_from_docstring(ast.get_docstring(child))
-                        if help_text:
-                            help_entry += f"\n#### Help:\n> {help_text}\n"
-                        else:
-                            help_entry += "\n#### Help:\n> No help provided.\n"
-                        
-                        help_entry += f"\n#### Usage:\n ```python\n{self.generate_usage_code(class_name, child.name, self._get_argument_details(child))}\n```\n"
-
-                        # Add "Back to Class" link
-                        help_entry += f"\n\n[Back to `{class_name}`](#{class_anchor}) or [Classes](#top)\n\n"
-
-                        class_methods[class_name].append(help_entry)
-                        help_content.append(help_entry)
-    
-            elif isinstance(node, ast.FunctionDef):
-                if node.name in self.exclusion_list:
-                    continue
-                
-                # Standalone function
-                func_anchor = f"func-{node.name.lower()}"
-                help_entry = f'<a id="{func_anchor}"></a>\n'
-                help_entry += f"## Function: `{node.name}`\n"
-                
-                
-                if self.args_seperatly == True:
-                    help_entry += "### Arguments:\n"
-                    arg_details = self._get_argument_details(node)
-                    help_entry += "\n".join(f"- {arg}" for arg in arg_details)
-                
-                help_text = self._extract_help_from_docstring(ast.get_docstring(node))
-                if help_text:
-                    help_entry += f"\n### Help:\n> {help_text}\n"
-                else:
-                    help_entry += "\n### Help:\n> No help provided.\n"
-                
-                help_entry += f"\n### Usage:\n```python\n{self.generate_usage_code(class_name, node.name, self._get_argument_details(node))}\n```\n"
+                rendered_fragments[i] = self._render_class(node, doc_cache)
+            else:
+                rendered_fragments[i] = [self._render_function(node, owner, doc_cache)]
+        
+        help_content = []
+        current_rendered = {}
+        for (node_name, checksum, _, owner), fragments in zip(render_entries, rendered_fragments):
+            help_content.extend(fragments)
+            current_rendered[node_name] = {"checksum": checksum, "owner": owner, "fragments": fragments}
 
-                help_entry += "\n[Back to top](#top)\n\n"
-                help_content.append(help_entry)
-    
         # Add table of contents at the top if we have content
         if help_content:
             toc = ['<a id="top"></a>\n']
             toc.append("## Table of Contents\n")
-            class_anchors = []
-            
-            # Collect all class anchors
-            for node in tree.body:
-                if isinstance(node, ast.ClassDef):
-                    class_anchor = f"class-{node.name.lower()}"
-                    class_anchors.append(f"[`{node.name}`](#{class_anchor})")
             
             # Add class links to TOC
-            if class_anchors:
+            if toc_classes:
                 toc.append("### Classes:\n")
-                toc.append(" | ".join(class_anchors))
+                toc.append(" | ".join(toc_classes))
                 toc.append("\n")
             
             # Add standalone function links to TOC
-            func_anchors = []
-            for node in tree.body:
-                if isinstance(node, ast.FunctionDef) and node.name not in self.exclusion_list:
-                    func_anchor = f"func-{node.name.lower()}"
-                    func_anchors.append(f"[`{node.name}`](#{func_anchor})")
-            
-            if func_anchors:
+            if toc_funcs:
                 toc.append("### Functions:\n")
-                toc.append(" | ".join(func_anchors))
+                toc.append(" | ".join(toc_funcs))
                 toc.append("\n")
             
             help_content.insert(0, "\n".join(toc))
     
         self._save_checksums(current_checksums)
+        self._save_rendered_cache(current_rendered)
         return "\n\n".join(help_content)
     
     def generate_usage_code(self, class_name, name, usage_args):
-        class_obj = f"self.{class_name.lower()}_obj"
-        usage_string = f"{class_obj} = {class_name}\n\n"
+        # Functions defined before any class are called directly
+        if class_name is None:
+            class_obj = None
+            usage_string = ""
+        else:
+            class_obj = f"self.{class_name.lower()}_obj"
+            usage_string = f"{class_obj} = {class_name}\n\n"
         
         # Filter out 'self' and clean arguments
         cleaned_args = []
@@ -419,7 +637,9 @@ class HelpFileGen:
             cleaned_args.append(param_part)
         
         # Determine the calling format based on argument count
-        if name == "__init__":
+        if class_obj is None:
+            call_prefix = f"{name}("
+        elif name == "__init__":
             call_prefix = f"{class_obj}("
         else:
             call_prefix = f"{class_obj}.{name}("
@@ -440,30 +660,51 @@ class HelpFileGen:
         
 
 
-    def _update_help_file_incrementally(self, new_content: str) -> None:
+    def _update_help_file_incrementally(self, new_content: str) -> bool:
         """Updates the help file incrementally by only changing modified sections.
         
         Args:
             new_content (str): The newly generated help content.
+            
+        Returns:
+            bool: True if the help file was written, False if it already held this content.
         """
-        if not os.path.exists(self.output_file):
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                f.write(new_content)
-            return
-
-        # For now, we'll just overwrite the file
+        # For now, we'll just rewrite the whole file when anything differs
         # A more sophisticated implementation would parse the existing file
         # and update only the changed sections
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            f.write(new_content)
+        return self._write_if_changed(self.output_file, new_content)
 
     def generate_help_file(self) -> None:
         """Generates or updates the help file based on the extracted help content."""
         if self.overwrite or not os.path.exists(self.output_file):
             help_content = self._generate_help_content()
             if help_content:  # Only write if there's new content
-                self._update_help_file_incrementally(help_content)
-                print(f"Help file generated/updated: {self.output_file}")
+                if self._update_help_file_incrementally(help_content):
+                    print(f"Help file generated/updated: {self.output_file}")
+                else:
+                    print(f"Help file is already up to date: {self.output_file}")
         else:
             print(f"Help file already exists and overwrite is set to False: {self.output_file}")
 
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Generates help files for every module given on the command line in a single process.
+
+    Args:
+        argv (list): Command line arguments, defaults to sys.argv[1:].
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate Markdown help files from Python docstrings.")
+    parser.add_argument("modules", nargs="+", help="Python modules to document.")
+    parser.add_argument("-o", "--output-file", default="help.md", help="Suffix of the generated Markdown file (default: help.md).")
+    parser.add_argument("--no-overwrite", action="store_true", help="Leave existing help files untouched.")
+    parser.add_argument("--include-args", action="store_true", help="List arguments in a separate section.")
+    args = parser.parse_args(argv)
+
+    for module_path in args.modules:
+        HelpFileGen(module_path, output_file=args.output_file, overwrite=not args.no_overwrite, include_args=args.include_args)
+
+
+if __name__ == "__main__":
+    main()